@@ -2,88 +2,140 @@
 """
 Quick Start Example - ABank Marketing Crew
 
-This script demonstrates how to run a simple product launch workflow.
+This script demonstrates how to run a marketing workflow. Heavy imports
+(crewai, the tool modules) are deferred until a workflow actually runs, so
+--help and --dry-run return immediately.
 """
 
+import argparse
 import os
 from datetime import datetime, timedelta
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
 
-# Set a dummy API key for demonstration (replace with real key)
-if not os.getenv("OPENAI_API_KEY"):
-    os.environ["OPENAI_API_KEY"] = "sk-demo-key-replace-with-real-key"
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="ABank Marketing Crew - Quick Start Example"
+    )
+    parser.add_argument(
+        '--workflow',
+        choices=['product_launch', 'real_time_response', 'personalized_journey'],
+        default='product_launch',
+        help='Workflow to run (default: product_launch)'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Print the workflow inputs and exit without importing or running the crew'
+    )
+    parser.add_argument(
+        '--allow-demo-key',
+        action='store_true',
+        help='Set a placeholder OPENAI_API_KEY when none is configured (demo only)'
+    )
+    return parser.parse_args()
+
+
+def build_inputs(workflow: str) -> dict:
+    """Build example inputs for the selected workflow"""
+    if workflow == "product_launch":
+        return {
+            "product_name": "Youth Digital Savings Account",
+            "launch_date": (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d"),
+            "target_regions": "Gauteng, Western Cape, KwaZulu-Natal",
+            "campaign_budget": "R500,000",
+            "product_features": "Zero monthly fees, 5% interest, mobile-first, instant account opening",
+            "pricing_strategy": "Competitive positioning against FNB Easy and Capitec Global One",
+            "campaign_duration": "3 months",
+            "success_criteria": "50,000 new accounts, R250M in deposits, NPS >70"
+        }
+    elif workflow == "real_time_response":
+        return {
+            "monitoring_priorities": "competitor_rates,economic_events,social_trends",
+            "alert_criteria": "medium"
+        }
+    else:
+        return {
+            "analysis_date": datetime.now().strftime("%Y-%m-%d"),
+            "focus_segments": "high_value,at_risk,dormant",
+            "personalization_depth": "individual"
+        }
 
-from abank_marketing_crew.crew import create_crew
 
 def main():
-    """Run a quick product launch example"""
-    
+    """Run a quick workflow example"""
+    args = parse_args()
+    inputs = build_inputs(args.workflow)
+
     print("\n" + "="*60)
     print(" ABank Marketing Crew - Quick Start Example")
     print("="*60 + "\n")
-    
-    # Define workflow inputs
-    inputs = {
-        "product_name": "Youth Digital Savings Account",
-        "launch_date": (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d"),
-        "target_regions": "Gauteng, Western Cape, KwaZulu-Natal",
-        "campaign_budget": "R500,000",
-        "product_features": "Zero monthly fees, 5% interest, mobile-first, instant account opening",
-        "pricing_strategy": "Competitive positioning against FNB Easy and Capitec Global One",
-        "campaign_duration": "3 months",
-        "success_criteria": "50,000 new accounts, R250M in deposits, NPS >70"
-    }
-    
-    print("Workflow: Product Launch Campaign")
-    print(f"Product: {inputs['product_name']}")
-    print(f"Launch Date: {inputs['launch_date']}")
-    print(f"Budget: {inputs['campaign_budget']}\n")
-    
+
+    print(f"Workflow: {args.workflow}")
+    for key, value in inputs.items():
+        print(f"  {key}: {value}")
+    print()
+
+    if args.dry_run:
+        print("Dry run - crew not imported or executed.\n")
+        return 0
+
+    # Heavy imports deferred until we know a workflow will actually run
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    if args.allow_demo_key and not os.getenv("OPENAI_API_KEY"):
+        # Placeholder key for demonstration only (replace with real key)
+        os.environ["OPENAI_API_KEY"] = "sk-demo-key-replace-with-real-key"
+
+    from abank_marketing_crew.crew import create_crew
+
     print("Creating marketing crew...")
-    
+
     try:
         # Create the crew
-        crew = create_crew(workflow="product_launch", verbose=True)
-        
+        crew = create_crew(workflow=args.workflow, verbose=True)
+
         print("\nExecuting workflow...\n")
         print("-" * 60)
-        
+
         # Execute the workflow
         result = crew.kickoff(inputs=inputs)
-        
+
         print("\n" + "="*60)
         print(" Workflow Completed Successfully!")
         print("="*60 + "\n")
-        
+
+        # Serialize once: prefer CrewAI's final raw text over stringifying
+        # the full nested task-output structure repeatedly
+        result_text = getattr(result, 'raw', None) or str(result)
+
         print("Result Summary:")
         print("-" * 60)
-        print(str(result)[:500] + "..." if len(str(result)) > 500 else str(result))
+        print(result_text[:500] + "..." if len(result_text) > 500 else result_text)
         print("-" * 60)
-        
+
         # Save result
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = f"product_launch_result_{timestamp}.txt"
-        
+        output_file = f"{args.workflow}_result_{timestamp}.txt"
+
         with open(output_file, 'w') as f:
-            f.write("ABank Marketing Crew - Product Launch Result\n")
+            f.write("ABank Marketing Crew - Workflow Result\n")
             f.write("=" * 60 + "\n\n")
             f.write(f"Timestamp: {datetime.now().isoformat()}\n")
-            f.write(f"Product: {inputs['product_name']}\n\n")
+            f.write(f"Workflow: {args.workflow}\n\n")
             f.write("Full Result:\n")
             f.write("-" * 60 + "\n")
-            f.write(str(result))
-        
+            f.write(result_text)
+
         print(f"\nFull result saved to: {output_file}\n")
-        
+
     except Exception as e:
         print(f"\n❌ Error: {str(e)}\n")
         print("Make sure you have set up your .env file with valid API keys.")
         print("See .env.example for required configuration.\n")
         return 1
-    
+
     return 0
 
 
@@ -8,6 +8,13 @@ at ABank using specialized AI agents.
 __version__ = "1.0.0"
 __author__ = "ABank AI Team"
 
-from abank_marketing_crew.crew import create_crew, MarketingCrew
+__all__ = ["create_crew", "get_or_create_crew", "MarketingCrew"]
 
-__all__ = ["create_crew", "MarketingCrew"]
+
+def __getattr__(name):
+    # Lazy re-exports (PEP 562): importing the package no longer drags in
+    # CrewAI's multi-second import chain until a crew symbol is touched
+    if name in __all__:
+        from abank_marketing_crew import crew
+        return getattr(crew, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
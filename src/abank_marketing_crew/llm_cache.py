@@ -0,0 +1,316 @@
+"""
+LLM Response Cache for ABank Marketing Crew
+
+Provides a CachedLLM wrapper around crewai.LLM that short-circuits repeated
+LLM calls. Exact repeats are matched on a sha256 digest of model + system
+prompt + user prompt; near-repeats fall back to a cosine-similarity lookup
+over embeddings of recently seen prompts. Responses are only cached for
+deterministic requests (temperature == 0) with no tools bound, so cached
+answers are always safe to replay.
+"""
+
+import hashlib
+import math
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from crewai import LLM
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# Embedding model used for the semantic fallback - matches the embedder
+# already configured on product_launch_crew
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+DEFAULT_CACHE_DIR = os.path.join(".cache", "llm_responses")
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    """Cosine similarity between two embedding vectors"""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(x * x for x in b))
+    if norm_a == 0.0 or norm_b == 0.0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+class ResponseCache:
+    """
+    Two-tier response cache: exact sha256 lookup backed by diskcache when
+    available (in-memory dict otherwise), plus an in-memory embedding index
+    of recent prompts for near-duplicate matching.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        ttl: int = DEFAULT_TTL_SECONDS,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        max_index_size: int = 256
+    ):
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.max_index_size = max_index_size
+
+        if diskcache is not None:
+            self._store = diskcache.Cache(cache_dir)
+        else:
+            self._store: Dict[str, Tuple[float, str]] = {}
+
+        # Recent (key, embedding) pairs for the semantic fallback
+        self._embedding_index: List[Tuple[str, List[float]]] = []
+        self._embedding_client = None
+
+    @staticmethod
+    def exact_key(model: str, system: str, user: str) -> str:
+        """Exact cache key: sha256 over model and prompt contents"""
+        payload = (model + "\0" + system + "\0" + user).encode()
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for an exact key, honouring TTL"""
+        if diskcache is not None:
+            return self._store.get(key)
+
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.time() - stored_at > self.ttl:
+            del self._store[key]
+            return None
+        return response
+
+    def get_similar(
+        self, user_prompt: str
+    ) -> Tuple[Optional[str], Optional[List[float]]]:
+        """
+        Semantic fallback: embed the prompt and return the cached response
+        of the nearest recent prompt if it clears the similarity threshold.
+
+        Also returns the prompt's embedding (when one was computed) so a
+        miss followed by put() reuses it instead of paying a second
+        embeddings round trip for the same text. An empty index short-
+        circuits before embedding - there is nothing to compare against.
+        """
+        if not self._embedding_index:
+            return None, None
+
+        embedding = self._embed(user_prompt)
+        if embedding is None:
+            return None, None
+
+        best_key = None
+        best_score = 0.0
+        for key, candidate in self._embedding_index:
+            score = _cosine_similarity(embedding, candidate)
+            if score > best_score:
+                best_key, best_score = key, score
+
+        if best_key is not None and best_score >= self.similarity_threshold:
+            return self.get(best_key), embedding
+        return None, embedding
+
+    def put(
+        self,
+        key: str,
+        user_prompt: str,
+        response: str,
+        embedding: Optional[List[float]] = None
+    ):
+        """
+        Store a response under its exact key and index its embedding.
+
+        Pass the embedding returned by a preceding get_similar() miss to
+        skip re-embedding the same prompt; it is only computed here when
+        the caller has none (e.g. the index was empty at lookup time).
+        """
+        if diskcache is not None:
+            self._store.set(key, response, expire=self.ttl)
+        else:
+            self._store[key] = (time.time(), response)
+
+        if embedding is None:
+            embedding = self._embed(user_prompt)
+        if embedding is not None:
+            self._embedding_index.append((key, embedding))
+            # LRU-style eviction of the oldest indexed prompts
+            if len(self._embedding_index) > self.max_index_size:
+                self._embedding_index.pop(0)
+
+    def _embed(self, text: str) -> Optional[List[float]]:
+        """
+        Embed text via the OpenAI embeddings API. Returns None when the
+        client is unavailable or the call fails - the cache then degrades
+        to exact-match only.
+        """
+        try:
+            if self._embedding_client is None:
+                from openai import OpenAI
+                self._embedding_client = OpenAI()
+            result = self._embedding_client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=text
+            )
+            return result.data[0].embedding
+        except Exception:
+            return None
+
+
+# Shared across all CachedLLM instances so every agent hits the same cache
+_shared_cache: Optional[ResponseCache] = None
+
+
+def get_shared_cache() -> ResponseCache:
+    """Return the process-wide response cache, creating it on first use"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ResponseCache()
+    return _shared_cache
+
+
+class CachedLLM(LLM):
+    """
+    Drop-in crewai.LLM subclass with response caching on .call().
+
+    Only deterministic requests (temperature == 0) without bound tools are
+    cached; everything else passes straight through to the underlying LLM.
+    Note that _agent_llm defaults OPENAI_TEMPERATURE to 0.7, so in the
+    shipped configuration the cache is a pass-through - set
+    OPENAI_TEMPERATURE=0 to opt agents into response caching.
+    """
+
+    def __init__(
+        self,
+        *args,
+        cache: Optional[ResponseCache] = None,
+        prompt_cache_markers: bool = False,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self._cache = cache or get_shared_cache()
+        self._prompt_cache_markers = prompt_cache_markers
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None):
+        if self._prompt_cache_markers and isinstance(messages, list):
+            messages = self._mark_static_prefix(messages)
+
+        if not self._is_cacheable(tools):
+            return super().call(
+                messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions
+            )
+
+        system_prompt, user_prompt = self._split_messages(messages)
+        key = ResponseCache.exact_key(str(self.model), system_prompt, user_prompt)
+
+        embedding = None
+        response = self._cache.get(key)
+        if response is None:
+            response, embedding = self._cache.get_similar(user_prompt)
+
+        if response is None:
+            response = super().call(
+                messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions
+            )
+            if isinstance(response, str):
+                self._cache.put(key, user_prompt, response, embedding=embedding)
+
+        return response
+
+    def call_batch(self, messages_batch: List[Any]) -> List[str]:
+        """
+        Dispatch a batch of independent prompt sets in one round through
+        litellm.batch_completion, so the requests share scheduling and any
+        provider-side prefix cache instead of paying N sequential round
+        trips. Cached entries are answered locally; only the misses are
+        sent to the provider.
+        """
+        responses: List[Optional[str]] = [None] * len(messages_batch)
+        pending: List[Tuple[int, Any, str]] = []
+
+        for index, messages in enumerate(messages_batch):
+            system_prompt, user_prompt = self._split_messages(messages)
+            key = ResponseCache.exact_key(str(self.model), system_prompt, user_prompt)
+            cached = self._cache.get(key) if self._is_cacheable(None) else None
+            if cached is not None:
+                responses[index] = cached
+            else:
+                pending.append((index, messages, key))
+
+        if pending:
+            import litellm
+
+            results = litellm.batch_completion(
+                model=self.model,
+                messages=[
+                    messages if isinstance(messages, list)
+                    else [{"role": "user", "content": messages}]
+                    for _, messages, _ in pending
+                ],
+                temperature=self.temperature
+            )
+            for (index, messages, key), result in zip(pending, results):
+                content = result["choices"][0]["message"]["content"]
+                responses[index] = content
+                if self._is_cacheable(None):
+                    _, user_prompt = self._split_messages(messages)
+                    self._cache.put(key, user_prompt, content)
+
+        return responses
+
+    def _is_cacheable(self, tools: Optional[List[Any]]) -> bool:
+        """Cache only deterministic, tool-free requests"""
+        if tools:
+            return False
+        return (self.temperature or 0) == 0
+
+    @staticmethod
+    def _mark_static_prefix(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Attach Anthropic cache_control markers to system messages so the
+        provider serves the static prompt prefix (role/goal/backstory) from
+        its KV cache instead of reprocessing it on every call.
+        """
+        marked = []
+        for message in messages:
+            content = message.get("content")
+            if message.get("role") == "system" and isinstance(content, str):
+                message = dict(message)
+                message["content"] = [{
+                    "type": "text",
+                    "text": content,
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            marked.append(message)
+        return marked
+
+    @staticmethod
+    def _split_messages(messages) -> Tuple[str, str]:
+        """Extract system and user prompt text from a call's messages"""
+        if isinstance(messages, str):
+            return "", messages
+
+        system_parts = []
+        user_parts = []
+        for message in messages:
+            content = message.get("content", "")
+            if not isinstance(content, str):
+                content = str(content)
+            if message.get("role") == "system":
+                system_parts.append(content)
+            else:
+                user_parts.append(content)
+        return "\n".join(system_parts), "\n".join(user_parts)
@@ -6,30 +6,47 @@ This module provides the CLI interface for running different marketing workflows
 and managing the autonomous multi-agent marketing system.
 """
 
+import os
 import sys
 import argparse
-import json
+import asyncio
+import orjson
 from datetime import datetime
+from enum import Enum
+from functools import cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 import logging
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-from abank_marketing_crew.crew import create_crew, MarketingCrew
 from abank_marketing_crew.utils.logging_config import setup_logging
-from abank_marketing_crew.utils.validators import validate_workflow_inputs
 
 # Setup logging
 logger = setup_logging()
-console = Console()
+
+# Rich UI only when a human is watching: in batch/server mode stdout is
+# redirected, yet Progress would still run its ~10 Hz repaint thread and
+# compete for the GIL with concurrent kickoffs
+INTERACTIVE = sys.stdout.isatty() and not os.environ.get("ABANK_BATCH")
+
+
+# Heavy imports (rich, crewai via the crew module, dotenv, openai) are
+# deferred to their call sites: --help and --report cold-start in tens of
+# milliseconds instead of paying the full CrewAI import chain
+
+
+@cache
+def _console():
+    """Rich console, imported and constructed on first use"""
+    from rich.console import Console
+    return Console()
+
+
+@cache
+def _load_env():
+    """Load .env once; set ABANK_SKIP_DOTENV to bypass entirely"""
+    if not os.environ.get("ABANK_SKIP_DOTENV"):
+        from dotenv import load_dotenv
+        load_dotenv()
 
 
 def display_banner():
@@ -44,10 +61,10 @@ def display_banner():
     ║                                                           ║
     ╚═══════════════════════════════════════════════════════════╝
     """
-    console.print(banner, style="bold cyan")
+    _console().print(banner, style="bold cyan")
 
 
-def run_product_launch_workflow(inputs: Dict[str, Any], verbose: bool = True) -> Dict[str, Any]:
+async def run_product_launch_workflow(inputs: Dict[str, Any], verbose: bool = True) -> Dict[str, Any]:
     """
     Execute product launch campaign workflow.
     
@@ -58,35 +75,50 @@ def run_product_launch_workflow(inputs: Dict[str, Any], verbose: bool = True) ->
     Returns:
         Workflow execution results
     """
-    console.print("\n[bold green]🚀 Initiating Product Launch Workflow[/bold green]\n")
+    _console().print("\n[bold green]🚀 Initiating Product Launch Workflow[/bold green]\n")
     
     # Display workflow parameters
-    params_table = Table(title="Workflow Parameters")
-    params_table.add_column("Parameter", style="cyan")
-    params_table.add_column("Value", style="yellow")
-    
-    for key, value in inputs.items():
-        params_table.add_row(key, str(value))
-    
-    console.print(params_table)
-    console.print()
+    if INTERACTIVE:
+        from rich.table import Table
+
+        params_table = Table(title="Workflow Parameters")
+        params_table.add_column("Parameter", style="cyan")
+        params_table.add_column("Value", style="yellow")
+
+        for key, value in inputs.items():
+            params_table.add_row(key, str(value))
+
+        _console().print(params_table)
+        _console().print()
     
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"product_launch inputs: {inputs}")
+
+    _load_env()
+    from openai import APIConnectionError, APIError, APITimeoutError, RateLimitError
+    from abank_marketing_crew.crew import get_or_create_crew
+
     try:
         # Create and run crew
-        crew = create_crew(workflow="product_launch", verbose=verbose)
+        crew = get_or_create_crew(workflow="product_launch", verbose=verbose)
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Executing workflow...", total=None)
-            
-            result = crew.kickoff(inputs=inputs)
-            
-            progress.update(task, completed=True)
+        if INTERACTIVE:
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=_console()
+            ) as progress:
+                task = progress.add_task("Executing workflow...", total=None)
+
+                result = await crew.kickoff_async(inputs=inputs)
+
+                progress.update(task, completed=True)
+        else:
+            result = await crew.kickoff_async(inputs=inputs)
         
-        console.print("\n[bold green]✓ Product Launch Workflow Completed Successfully![/bold green]\n")
+        _console().print("\n[bold green]✓ Product Launch Workflow Completed Successfully![/bold green]\n")
         
         return {
             "status": "success",
@@ -95,9 +127,22 @@ def run_product_launch_workflow(inputs: Dict[str, Any], verbose: bool = True) ->
             "result": result
         }
         
-    except Exception as e:
-        logger.error(f"Product launch workflow failed: {str(e)}", exc_info=True)
-        console.print(f"\n[bold red]✗ Workflow Failed: {str(e)}[/bold red]\n")
+    except (RateLimitError, APITimeoutError, APIConnectionError) as e:
+        # Expected transient provider errors: log without exc_info so no
+        # frame-walking traceback formatting runs per failing request
+        logger.error(f"Product launch workflow hit a transient provider error: {str(e)}")
+        _console().print(f"\n[bold red]✗ Workflow Failed (transient): {str(e)}[/bold red]\n")
+        return {
+            "status": "failed",
+            "workflow": "product_launch",
+            "timestamp": datetime.now().isoformat(),
+            "error": str(e),
+            "transient": True
+        }
+
+    except (APIError, TimeoutError, ValueError, RuntimeError) as e:
+        logger.error(f"Product launch workflow failed: {str(e)}", exc_info=verbose)
+        _console().print(f"\n[bold red]✗ Workflow Failed: {str(e)}[/bold red]\n")
         return {
             "status": "failed",
             "workflow": "product_launch",
@@ -106,7 +151,7 @@ def run_product_launch_workflow(inputs: Dict[str, Any], verbose: bool = True) ->
         }
 
 
-def run_real_time_response_workflow(inputs: Dict[str, Any], verbose: bool = True) -> Dict[str, Any]:
+async def run_real_time_response_workflow(inputs: Dict[str, Any], verbose: bool = True) -> Dict[str, Any]:
     """
     Execute real-time market response workflow.
     
@@ -117,23 +162,35 @@ def run_real_time_response_workflow(inputs: Dict[str, Any], verbose: bool = True
     Returns:
         Workflow execution results
     """
-    console.print("\n[bold yellow]⚡ Initiating Real-Time Response Workflow[/bold yellow]\n")
+    _console().print("\n[bold yellow]⚡ Initiating Real-Time Response Workflow[/bold yellow]\n")
     
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"real_time_response inputs: {inputs}")
+
+    _load_env()
+    from openai import APIConnectionError, APIError, APITimeoutError, RateLimitError
+    from abank_marketing_crew.crew import get_or_create_crew
+
     try:
-        crew = create_crew(workflow="real_time_response", verbose=verbose)
+        crew = get_or_create_crew(workflow="real_time_response", verbose=verbose)
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Monitoring and responding...", total=None)
-            
-            result = crew.kickoff(inputs=inputs)
-            
-            progress.update(task, completed=True)
+        if INTERACTIVE:
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=_console()
+            ) as progress:
+                task = progress.add_task("Monitoring and responding...", total=None)
+
+                result = await crew.kickoff_async(inputs=inputs)
+
+                progress.update(task, completed=True)
+        else:
+            result = await crew.kickoff_async(inputs=inputs)
         
-        console.print("\n[bold green]✓ Real-Time Response Completed![/bold green]\n")
+        _console().print("\n[bold green]✓ Real-Time Response Completed![/bold green]\n")
         
         return {
             "status": "success",
@@ -142,9 +199,22 @@ def run_real_time_response_workflow(inputs: Dict[str, Any], verbose: bool = True
             "result": result
         }
         
-    except Exception as e:
-        logger.error(f"Real-time response workflow failed: {str(e)}", exc_info=True)
-        console.print(f"\n[bold red]✗ Workflow Failed: {str(e)}[/bold red]\n")
+    except (RateLimitError, APITimeoutError, APIConnectionError) as e:
+        # Expected transient provider errors: log without exc_info so no
+        # frame-walking traceback formatting runs per failing request
+        logger.error(f"Real-time response workflow hit a transient provider error: {str(e)}")
+        _console().print(f"\n[bold red]✗ Workflow Failed (transient): {str(e)}[/bold red]\n")
+        return {
+            "status": "failed",
+            "workflow": "real_time_response",
+            "timestamp": datetime.now().isoformat(),
+            "error": str(e),
+            "transient": True
+        }
+
+    except (APIError, TimeoutError, ValueError, RuntimeError) as e:
+        logger.error(f"Real-time response workflow failed: {str(e)}", exc_info=verbose)
+        _console().print(f"\n[bold red]✗ Workflow Failed: {str(e)}[/bold red]\n")
         return {
             "status": "failed",
             "workflow": "real_time_response",
@@ -153,7 +223,7 @@ def run_real_time_response_workflow(inputs: Dict[str, Any], verbose: bool = True
         }
 
 
-def run_personalized_journey_workflow(inputs: Dict[str, Any], verbose: bool = True) -> Dict[str, Any]:
+async def run_personalized_journey_workflow(inputs: Dict[str, Any], verbose: bool = True) -> Dict[str, Any]:
     """
     Execute personalized customer journey workflow.
     
@@ -164,23 +234,35 @@ def run_personalized_journey_workflow(inputs: Dict[str, Any], verbose: bool = Tr
     Returns:
         Workflow execution results
     """
-    console.print("\n[bold magenta]👤 Initiating Personalized Journey Workflow[/bold magenta]\n")
+    _console().print("\n[bold magenta]👤 Initiating Personalized Journey Workflow[/bold magenta]\n")
     
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"personalized_journey inputs: {inputs}")
+
+    _load_env()
+    from openai import APIConnectionError, APIError, APITimeoutError, RateLimitError
+    from abank_marketing_crew.crew import get_or_create_crew
+
     try:
-        crew = create_crew(workflow="personalized_journey", verbose=verbose)
+        crew = get_or_create_crew(workflow="personalized_journey", verbose=verbose)
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Personalizing customer journeys...", total=None)
-            
-            result = crew.kickoff(inputs=inputs)
-            
-            progress.update(task, completed=True)
+        if INTERACTIVE:
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=_console()
+            ) as progress:
+                task = progress.add_task("Personalizing customer journeys...", total=None)
+
+                result = await crew.kickoff_async(inputs=inputs)
+
+                progress.update(task, completed=True)
+        else:
+            result = await crew.kickoff_async(inputs=inputs)
         
-        console.print("\n[bold green]✓ Personalized Journey Workflow Completed![/bold green]\n")
+        _console().print("\n[bold green]✓ Personalized Journey Workflow Completed![/bold green]\n")
         
         return {
             "status": "success",
@@ -189,9 +271,22 @@ def run_personalized_journey_workflow(inputs: Dict[str, Any], verbose: bool = Tr
             "result": result
         }
         
-    except Exception as e:
-        logger.error(f"Personalized journey workflow failed: {str(e)}", exc_info=True)
-        console.print(f"\n[bold red]✗ Workflow Failed: {str(e)}[/bold red]\n")
+    except (RateLimitError, APITimeoutError, APIConnectionError) as e:
+        # Expected transient provider errors: log without exc_info so no
+        # frame-walking traceback formatting runs per failing request
+        logger.error(f"Personalized journey workflow hit a transient provider error: {str(e)}")
+        _console().print(f"\n[bold red]✗ Workflow Failed (transient): {str(e)}[/bold red]\n")
+        return {
+            "status": "failed",
+            "workflow": "personalized_journey",
+            "timestamp": datetime.now().isoformat(),
+            "error": str(e),
+            "transient": True
+        }
+
+    except (APIError, TimeoutError, ValueError, RuntimeError) as e:
+        logger.error(f"Personalized journey workflow failed: {str(e)}", exc_info=verbose)
+        _console().print(f"\n[bold red]✗ Workflow Failed: {str(e)}[/bold red]\n")
         return {
             "status": "failed",
             "workflow": "personalized_journey",
@@ -200,24 +295,238 @@ def run_personalized_journey_workflow(inputs: Dict[str, Any], verbose: bool = Tr
         }
 
 
-def run_interactive_mode():
+class Workflow(str, Enum):
+    """Workflow identifiers; argparse choices derive from the values"""
+    PRODUCT_LAUNCH = "product_launch"
+    REAL_TIME_RESPONSE = "real_time_response"
+    PERSONALIZED_JOURNEY = "personalized_journey"
+
+
+# Dispatch table for the async workflow runners; str-valued enum members
+# hash equal to their strings, so both key forms resolve here
+WORKFLOW_RUNNERS = {
+    Workflow.PRODUCT_LAUNCH: run_product_launch_workflow,
+    Workflow.REAL_TIME_RESPONSE: run_real_time_response_workflow,
+    Workflow.PERSONALIZED_JOURNEY: run_personalized_journey_workflow
+}
+
+
+# Default CLI inputs built lazily - only the selected workflow's thunk
+# runs, and registering a new workflow means one entry here plus one in
+# WORKFLOW_RUNNERS instead of another elif arm in main()
+DEFAULT_INPUTS: Dict[Workflow, Callable[[argparse.Namespace], Dict[str, Any]]] = {
+    Workflow.PRODUCT_LAUNCH: lambda args: {
+        "product_name": args.product,
+        "launch_date": (datetime.now()).strftime("%Y-%m-%d"),
+        "target_regions": ["Gauteng", "Western Cape", "KZN"],
+        "campaign_budget": "R500,000",
+        "product_features": "High-interest savings, mobile-first, no fees",
+        "pricing_strategy": "Competitive rate positioning"
+    },
+    Workflow.REAL_TIME_RESPONSE: lambda args: {
+        "monitoring_priorities": "competitor_rates,economic_events,social_trends",
+        "alert_criteria": "medium"
+    },
+    Workflow.PERSONALIZED_JOURNEY: lambda args: {
+        "analysis_date": datetime.now().strftime("%Y-%m-%d"),
+        "focus_segments": "high_value,at_risk,dormant",
+        "personalization_depth": "individual"
+    }
+}
+
+
+async def run_many(
+    jobs: list,
+    max_concurrent: int = 10,
+    verbose: bool = True
+) -> list:
+    """
+    Fan out several workflow runs concurrently.
+
+    The workflows are latency-bound on LLM API I/O, so running them under
+    asyncio.gather collapses total wall-clock towards the slowest job. A
+    semaphore caps in-flight workflows to respect provider rate limits.
+
+    Args:
+        jobs: List of (workflow, inputs) pairs
+        max_concurrent: Maximum workflows in flight at once
+        verbose: Forwarded to each workflow runner
+
+    Returns:
+        Per-job result dicts (exceptions returned in place, not raised),
+        aligned with the input order
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def run_one(workflow: str, inputs: Dict[str, Any]):
+        async with semaphore:
+            return await WORKFLOW_RUNNERS[workflow](inputs, verbose=verbose)
+
+    tasks = [asyncio.create_task(run_one(workflow, inputs)) for workflow, inputs in jobs]
+    return list(await asyncio.gather(*tasks, return_exceptions=True))
+
+
+# Task name prefixes selecting each workflow's tasks from tasks.yaml
+WORKFLOW_TASK_PREFIXES = {
+    "product_launch": "product_launch_",
+    "real_time_response": "real_time_",
+    "personalized_journey": "journey_"
+}
+
+
+def run_batch_api_workflow(workflow: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Execute a workflow through the provider Batch API instead of
+    realtime kickoff calls.
+
+    Every task in the workflow is rendered into a standalone chat
+    request (agent role/goal/backstory as the system prompt, the
+    interpolated task description as the user prompt), submitted as one
+    batch, and polled until completion. Batch pricing is roughly half
+    the synchronous rate with a 24-hour window, so this mode suits
+    overnight or scheduled runs where latency does not matter.
+
+    Because the batch executes requests independently, tasks are drafted
+    from their rendered prompts without the upstream task outputs that
+    sequential kickoff would chain through; results are keyed by task
+    name for downstream assembly.
+
+    Args:
+        workflow: Workflow type whose tasks should be batched
+        inputs: Workflow input parameters
+
+    Returns:
+        Workflow execution results with per-task outputs
+    """
+    _load_env()
+    from abank_marketing_crew.crew import (
+        DEFAULT_ANTHROPIC_MODEL,
+        DEFAULT_OPENAI_MODEL,
+        MarketingCrew
+    )
+    from abank_marketing_crew.utils.batch_api import (
+        build_chat_request,
+        submit_batch,
+        wait_for_batch,
+        fetch_results
+    )
+
+    provider = os.getenv("PRIMARY_LLM_PROVIDER", "openai").lower()
+    if provider == "anthropic":
+        model = os.getenv("ANTHROPIC_MODEL", DEFAULT_ANTHROPIC_MODEL)
+    else:
+        model = os.getenv("OPENAI_MODEL", DEFAULT_OPENAI_MODEL)
+
+    crew_instance = MarketingCrew(verbose=False)
+    prefix = WORKFLOW_TASK_PREFIXES[workflow]
+
+    requests = []
+    for task_name, task_config in crew_instance.tasks_config_data.items():
+        if not task_name.startswith(prefix):
+            continue
+        description, expected_output = crew_instance.render_task_prompt(task_name, inputs)
+        agent_config = crew_instance.agents_config_data[task_config['agent']]
+        system_prompt = (
+            f"You are {agent_config['role']}. {agent_config['backstory']}\n"
+            f"Your personal goal is: {agent_config['goal']}"
+        )
+        user_prompt = f"{description}\n\nExpected output:\n{expected_output}"
+        requests.append(build_chat_request(task_name, model, system_prompt, user_prompt))
+
+    _console().print(
+        f"\n[bold cyan]📤 Submitting {len(requests)} task prompts to the "
+        f"{provider} Batch API[/bold cyan]\n"
+    )
+
+    try:
+        batch_id = submit_batch(requests, provider=provider)
+        _console().print(f"Batch [bold]{batch_id}[/bold] submitted; polling for completion...")
+
+        batch = wait_for_batch(batch_id, provider=provider)
+        outputs = fetch_results(batch, provider=provider)
+
+        _console().print(f"\n[bold green]✓ Batch completed: {len(outputs)}/{len(requests)} tasks[/bold green]\n")
+
+        return {
+            "status": "success",
+            "workflow": f"{workflow}_batch_api",
+            "timestamp": datetime.now().isoformat(),
+            "batch_id": batch_id,
+            "result": outputs
+        }
+
+    except Exception as e:
+        logger.error(f"Batch API workflow failed: {str(e)}", exc_info=True)
+        _console().print(f"\n[bold red]✗ Batch API Workflow Failed: {str(e)}[/bold red]\n")
+        return {
+            "status": "failed",
+            "workflow": f"{workflow}_batch_api",
+            "timestamp": datetime.now().isoformat(),
+            "error": str(e)
+        }
+
+
+def run_config_file(config_path: str) -> Dict[str, Any]:
+    """
+    Run a workflow from a JSON/YAML config file, bypassing all prompts.
+
+    Scripted drivers (cron, CI, expect pipelines) previously had to
+    answer the interactive console.input sequence over a pty; a config
+    file dispatches straight to the workflow runner with zero stdin
+    round-trips.
+
+    The file must contain a 'workflow' key naming the workflow and
+    either an 'inputs' mapping or the input fields inline alongside it.
+
+    Args:
+        config_path: Path to the JSON or YAML config file
+
+    Returns:
+        Workflow execution results
+    """
+    import yaml
+
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+
+    workflow = config.get("workflow")
+    if workflow not in WORKFLOW_RUNNERS:
+        raise ValueError(
+            f"Config {config_path} must set 'workflow' to one of: "
+            f"{', '.join(WORKFLOW_RUNNERS)}"
+        )
+
+    inputs = config.get("inputs")
+    if inputs is None:
+        inputs = {key: value for key, value in config.items() if key != "workflow"}
+
+    return asyncio.run(WORKFLOW_RUNNERS[workflow](inputs))
+
+
+def run_interactive_mode(config_path: Optional[str] = None):
     """Run crew in interactive mode with CLI prompts"""
-    console.print("\n[bold cyan]🤖 Interactive Mode[/bold cyan]\n")
-    
+    # A config file replaces the prompt sequence entirely
+    if config_path:
+        results = run_config_file(config_path)
+        save_results(results)
+        return
+
+    _console().print("\n[bold cyan]🤖 Interactive Mode[/bold cyan]\n")
+
     # Select workflow
-    console.print("Available Workflows:")
-    console.print("  1. Product Launch Campaign")
-    console.print("  2. Real-Time Market Response")
-    console.print("  3. Personalized Customer Journey")
-    console.print("  4. Exit\n")
+    _console().print("Available Workflows:")
+    _console().print("  1. Product Launch Campaign")
+    _console().print("  2. Real-Time Market Response")
+    _console().print("  3. Personalized Customer Journey")
+    _console().print("  4. Exit\n")
     
-    choice = console.input("[bold]Select workflow (1-4): [/bold]")
+    choice = _console().input("[bold]Select workflow (1-4): [/bold]")
     
     if choice == "1":
-        product_name = console.input("[bold]Product Name: [/bold]")
-        launch_date = console.input("[bold]Launch Date (YYYY-MM-DD): [/bold]")
-        target_regions = console.input("[bold]Target Regions (comma-separated): [/bold]")
-        budget = console.input("[bold]Campaign Budget (ZAR): [/bold]")
+        product_name = _console().input("[bold]Product Name: [/bold]")
+        launch_date = _console().input("[bold]Launch Date (YYYY-MM-DD): [/bold]")
+        target_regions = _console().input("[bold]Target Regions (comma-separated): [/bold]")
+        budget = _console().input("[bold]Campaign Budget (ZAR): [/bold]")
         
         inputs = {
             "product_name": product_name,
@@ -228,22 +537,22 @@ def run_interactive_mode():
             "pricing_strategy": "To be determined"
         }
         
-        run_product_launch_workflow(inputs)
+        asyncio.run(run_product_launch_workflow(inputs))
         
     elif choice == "2":
-        monitoring_focus = console.input("[bold]Monitoring Focus: [/bold]")
-        alert_threshold = console.input("[bold]Alert Threshold (low/medium/high): [/bold]")
+        monitoring_focus = _console().input("[bold]Monitoring Focus: [/bold]")
+        alert_threshold = _console().input("[bold]Alert Threshold (low/medium/high): [/bold]")
         
         inputs = {
             "monitoring_priorities": monitoring_focus,
             "alert_criteria": alert_threshold
         }
         
-        run_real_time_response_workflow(inputs)
+        asyncio.run(run_real_time_response_workflow(inputs))
         
     elif choice == "3":
         analysis_date = datetime.now().strftime("%Y-%m-%d")
-        focus_areas = console.input("[bold]Focus Segments: [/bold]")
+        focus_areas = _console().input("[bold]Focus Segments: [/bold]")
         
         inputs = {
             "analysis_date": analysis_date,
@@ -251,13 +560,13 @@ def run_interactive_mode():
             "personalization_depth": "individual"
         }
         
-        run_personalized_journey_workflow(inputs)
+        asyncio.run(run_personalized_journey_workflow(inputs))
         
     elif choice == "4":
-        console.print("\n[bold]Goodbye! 👋[/bold]\n")
+        _console().print("\n[bold]Goodbye! 👋[/bold]\n")
         sys.exit(0)
     else:
-        console.print("\n[bold red]Invalid choice. Please try again.[/bold red]\n")
+        _console().print("\n[bold red]Invalid choice. Please try again.[/bold red]\n")
 
 
 def save_results(results: Dict[str, Any], output_dir: str = "outputs"):
@@ -276,11 +585,21 @@ def save_results(results: Dict[str, Any], output_dir: str = "outputs"):
     filename = f"{workflow}_{timestamp}.json"
     
     filepath = output_path / filename
-    
-    with open(filepath, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
-    
-    console.print(f"\n[bold green]Results saved to: {filepath}[/bold green]\n")
+
+    # orjson serializes to bytes in C in one pass - markedly faster than
+    # stdlib json for large crew outputs, which matters in batch mode.
+    # Publish atomically: write_bytes to a sibling tmp file, then
+    # os.replace, so a crash mid-write never leaves readers a truncated
+    # JSON file
+    tmp_path = filepath.with_suffix('.json.tmp')
+    tmp_path.write_bytes(orjson.dumps(
+        results,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        default=str
+    ))
+    os.replace(tmp_path, filepath)
+
+    _console().print(f"\n[bold green]Results saved to: {filepath}[/bold green]\n")
 
 
 def main():
@@ -306,8 +625,9 @@ Examples:
     
     parser.add_argument(
         '--workflow',
-        choices=['product_launch', 'real_time_response', 'personalized_journey'],
-        help='Workflow type to execute'
+        action='append',
+        choices=[workflow.value for workflow in Workflow],
+        help='Workflow type to execute; repeat the flag to run several concurrently'
     )
     
     parser.add_argument(
@@ -322,6 +642,18 @@ Examples:
         help='Execution mode'
     )
     
+    parser.add_argument(
+        '--input-file',
+        help='JSONL file with one inputs dict per line for batch execution'
+    )
+
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=10,
+        help='Maximum concurrent workflow runs in batch mode (default: 10)'
+    )
+
     parser.add_argument(
         '--interactive',
         action='store_true',
@@ -363,66 +695,107 @@ Examples:
     display_banner()
     
     try:
+        # Batch execution over a JSONL input file
+        if args.input_file:
+            from abank_marketing_crew.batch import run_batch, iter_jsonl, ResultsWriter
+
+            if not args.workflow:
+                _console().print("[bold red]Error: --workflow required with --input-file[/bold red]")
+                return
+
+            if len(args.workflow) > 1:
+                _console().print("[bold red]Error: --input-file takes exactly one --workflow[/bold red]")
+                return
+
+            input_workflow = args.workflow[0]
+            inputs_list = list(iter_jsonl(args.input_file))
+            _console().print(
+                f"\n[bold cyan]📦 Batch mode: {len(inputs_list)} rows, "
+                f"max {args.max_concurrency} concurrent[/bold cyan]\n"
+            )
+
+            # One append-only JSONL artifact per run when --save-results
+            # is set: rows land on disk as they finish, so a crash keeps
+            # everything completed so far
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            results_path = Path("outputs") / f"{input_workflow}_batch_{timestamp}.jsonl"
+            writer = ResultsWriter(results_path) if args.save_results else None
+
+            try:
+                batch_results = asyncio.run(run_batch(
+                    input_workflow,
+                    inputs_list,
+                    max_concurrency=args.max_concurrency,
+                    results_writer=writer
+                ))
+            finally:
+                if writer is not None:
+                    writer.close()
+
+            succeeded = sum(1 for r in batch_results if r.get("status") == "success")
+            _console().print(
+                f"\n[bold green]Batch complete: {succeeded}/{len(batch_results)} succeeded[/bold green]\n"
+            )
+            if args.save_results:
+                _console().print(f"[bold green]Results streamed to: {results_path}[/bold green]\n")
+            return
+
         # Interactive mode
         if args.interactive or (not args.workflow and not args.report):
-            run_interactive_mode()
+            run_interactive_mode(config_path=args.config)
             return
         
         # Report generation
         if args.report:
-            console.print("[bold yellow]Report generation not yet implemented[/bold yellow]")
+            _console().print("[bold yellow]Report generation not yet implemented[/bold yellow]")
             return
         
-        # Workflow execution
-        if args.workflow == 'product_launch':
-            if not args.product:
-                console.print("[bold red]Error: --product required for product_launch workflow[/bold red]")
+        # Workflow execution: one enum-keyed dispatch instead of a
+        # string elif chain per workflow
+        workflows = [Workflow(name) for name in args.workflow]
+
+        if Workflow.PRODUCT_LAUNCH in workflows and not args.product:
+            _console().print("[bold red]Error: --product required for product_launch workflow[/bold red]")
+            return
+
+        # Several --workflow flags fan out through run_many so the
+        # independent kickoffs overlap instead of running back to back
+        if len(workflows) > 1:
+            if args.mode == 'batch':
+                _console().print("[bold red]Error: --mode batch takes exactly one --workflow[/bold red]")
                 return
-            
-            inputs = {
-                "product_name": args.product,
-                "launch_date": (datetime.now()).strftime("%Y-%m-%d"),
-                "target_regions": ["Gauteng", "Western Cape", "KZN"],
-                "campaign_budget": "R500,000",
-                "product_features": "High-interest savings, mobile-first, no fees",
-                "pricing_strategy": "Competitive rate positioning"
-            }
-            
-            results = run_product_launch_workflow(inputs, verbose=args.verbose)
-            
-            if args.save_results:
-                save_results(results)
-        
-        elif args.workflow == 'real_time_response':
-            inputs = {
-                "monitoring_priorities": "competitor_rates,economic_events,social_trends",
-                "alert_criteria": "medium"
-            }
-            
-            results = run_real_time_response_workflow(inputs, verbose=args.verbose)
-            
-            if args.save_results:
-                save_results(results)
-        
-        elif args.workflow == 'personalized_journey':
-            inputs = {
-                "analysis_date": datetime.now().strftime("%Y-%m-%d"),
-                "focus_segments": "high_value,at_risk,dormant",
-                "personalization_depth": "individual"
-            }
-            
-            results = run_personalized_journey_workflow(inputs, verbose=args.verbose)
-            
+
+            jobs = [(workflow.value, DEFAULT_INPUTS[workflow](args)) for workflow in workflows]
+            results_list = asyncio.run(run_many(
+                jobs,
+                max_concurrent=args.max_concurrency,
+                verbose=args.verbose
+            ))
+
             if args.save_results:
-                save_results(results)
+                for results in results_list:
+                    if isinstance(results, dict):
+                        save_results(results)
+            return
+
+        workflow = workflows[0]
+        inputs = DEFAULT_INPUTS[workflow](args)
+
+        if args.mode == 'batch':
+            results = run_batch_api_workflow(workflow.value, inputs)
+        else:
+            results = asyncio.run(WORKFLOW_RUNNERS[workflow](inputs, verbose=args.verbose))
+
+        if args.save_results:
+            save_results(results)
     
     except KeyboardInterrupt:
-        console.print("\n\n[bold yellow]Workflow interrupted by user[/bold yellow]\n")
+        _console().print("\n\n[bold yellow]Workflow interrupted by user[/bold yellow]\n")
         sys.exit(1)
     
     except Exception as e:
         logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-        console.print(f"\n[bold red]Fatal Error: {str(e)}[/bold red]\n")
+        _console().print(f"\n[bold red]Fatal Error: {str(e)}[/bold red]\n")
         sys.exit(1)
 
 
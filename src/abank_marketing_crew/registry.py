@@ -0,0 +1,57 @@
+"""
+Shared Agent Registry for ABank Marketing Crew
+
+Process-wide registry that deduplicates agent instances across
+MarketingCrew instances. The per-instance memoization in crew.py keeps a
+single MarketingCrew from rebuilding its own agents; this registry extends
+that guarantee across instances (tests, server mode, repeated
+create_crew() calls), collapsing N LLM client setups per agent to one.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict
+
+AGENTS: Dict[str, Any] = {}
+
+# One lock per agent name so independent factories build concurrently -
+# warm_up() fans the six builders across a thread pool, and a single
+# module-wide lock would quietly serialize them again. The module lock
+# only guards the lock table and registry bookkeeping itself.
+_lock = threading.Lock()
+_name_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+
+
+def get_agent(name: str, factory: Callable[[], Any]) -> Any:
+    """
+    Return the registered agent for a name, building it on first use.
+
+    Args:
+        name: Registry key, conventionally the agents.yaml entry name
+        factory: Zero-argument callable that builds the agent
+
+    Returns:
+        The shared agent instance for this process
+    """
+    agent = AGENTS.get(name)
+    if agent is not None:
+        return agent
+
+    with _lock:
+        name_lock = _name_locks[name]
+
+    with name_lock:
+        # Re-check under the per-name lock: a concurrent builder for the
+        # same name may have won the race while this one waited
+        agent = AGENTS.get(name)
+        if agent is None:
+            agent = factory()
+            AGENTS[name] = agent
+        return agent
+
+
+def clear():
+    """Drop all registered agents (primarily for tests)"""
+    with _lock:
+        AGENTS.clear()
+        _name_locks.clear()
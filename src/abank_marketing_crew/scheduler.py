@@ -0,0 +1,106 @@
+"""
+DAG Task Scheduler for ABank Marketing Crew
+
+Schedules CrewAI tasks by their real dependency graph instead of a
+hand-ordered list. Each task's context=[...] already encodes its upstream
+edges; the scheduler dispatches every task whose dependencies have
+completed, so any pair of tasks with disjoint context sets runs
+concurrently without per-task async_execution tagging.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from abank_marketing_crew.task_cache import TaskOutputCache, output_hash
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+def _upstream(task) -> List[Any]:
+    """Upstream tasks referenced by a task's context list"""
+    context = getattr(task, 'context', None)
+    return list(context) if context else []
+
+
+def _output_text(output: Any) -> str:
+    """Raw text of a completed task output"""
+    raw = getattr(output, 'raw', None)
+    return raw if isinstance(raw, str) else str(output)
+
+
+async def run_dag_async(
+    tasks: List[Any],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    cache: Optional[TaskOutputCache] = None
+) -> List[Any]:
+    """
+    Execute tasks in topological order with bounded parallelism.
+
+    Every task waits only for the tasks in its own context, then runs in
+    a worker thread (task execution is blocking I/O against the LLM
+    provider) under a shared semaphore that caps in-flight executions.
+    Returns the task outputs in the order the tasks were given.
+
+    When a cache is supplied, each task is first looked up by its
+    rendered prompt, agent role, and upstream output hashes; a hit skips
+    the agent invocation entirely and feeds the cached output downstream.
+
+    Args:
+        tasks: Tasks whose context lists describe the dependency DAG
+        max_concurrency: Maximum number of tasks in flight at once
+        cache: Optional task output cache consulted before execution
+
+    Returns:
+        List of task outputs, positionally matching the input tasks
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    events: Dict[int, asyncio.Event] = {id(task): asyncio.Event() for task in tasks}
+    outputs: Dict[int, Any] = {}
+
+    async def run_one(task):
+        dependencies = [dep for dep in _upstream(task) if id(dep) in events]
+        for dependency in dependencies:
+            await events[id(dependency)].wait()
+
+        context_text = "\n\n".join(
+            _output_text(outputs[id(dependency)]) for dependency in dependencies
+        )
+
+        cache_key = None
+        output = None
+        if cache is not None:
+            cache_key = TaskOutputCache.key(
+                task_prompt=getattr(task, 'description', ''),
+                agent_role=getattr(task.agent, 'role', ''),
+                context_hashes=[
+                    output_hash(outputs[id(dependency)]) for dependency in dependencies
+                ]
+            )
+            output = cache.get(cache_key)
+
+        if output is None:
+            async with semaphore:
+                output = await asyncio.to_thread(
+                    task.execute_sync,
+                    agent=task.agent,
+                    context=context_text or None
+                )
+            if cache is not None:
+                cache.put(cache_key, output)
+
+        outputs[id(task)] = output
+        events[id(task)].set()
+        return output
+
+    return list(await asyncio.gather(*(run_one(task) for task in tasks)))
+
+
+def run_dag(
+    tasks: List[Any],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    cache: Optional[TaskOutputCache] = None
+) -> List[Any]:
+    """Synchronous wrapper around run_dag_async"""
+    return asyncio.run(
+        run_dag_async(tasks, max_concurrency=max_concurrency, cache=cache)
+    )
@@ -0,0 +1,109 @@
+"""
+Task Output Cache for ABank Marketing Crew
+
+Operator-level caching at the Task boundary. Where the LLM response cache
+catches exact prompt repeats, this cache keys on task identity - the
+rendered task prompt, the agent role, and the hashes of upstream outputs -
+so a rerun of market analysis for the same product reuses the prior task
+output even when the exact LLM prompts CrewAI composes differ between
+runs (tool-call variance, reasoning retries).
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+DEFAULT_TTL_SECONDS = 86400
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "abank_marketing_crew", "task_outputs"
+)
+
+
+def output_hash(output: Any) -> str:
+    """Stable hash of a task output's raw text"""
+    raw = getattr(output, 'raw', None)
+    text = raw if isinstance(raw, str) else str(output)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class TaskOutputCache:
+    """
+    Persistent cache of completed task outputs.
+
+    Backed by diskcache with TTL eviction when the package is installed,
+    degrading to an in-memory TTL dict otherwise (same pattern as the
+    LLM response cache).
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        ttl: int = DEFAULT_TTL_SECONDS
+    ):
+        self.ttl = ttl
+
+        if diskcache is not None:
+            self._store = diskcache.Cache(cache_dir)
+        else:
+            self._store: Dict[str, Tuple[float, Any]] = {}
+
+    @staticmethod
+    def key(
+        task_prompt: str,
+        agent_role: str,
+        context_hashes: Iterable[str] = ()
+    ) -> str:
+        """
+        Cache key for one task execution: the rendered prompt, the agent
+        role, and the hashes of the upstream outputs it consumed.
+        """
+        payload = json.dumps(
+            {
+                "task_prompt": task_prompt,
+                "agent_role": agent_role,
+                "context_hashes": list(context_hashes)
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached task output for a key, honouring TTL"""
+        if diskcache is not None:
+            return self._store.get(key)
+
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        stored_at, output = entry
+        if time.time() - stored_at > self.ttl:
+            del self._store[key]
+            return None
+        return output
+
+    def put(self, key: str, output: Any):
+        """Store a completed task output"""
+        if diskcache is not None:
+            self._store.set(key, output, expire=self.ttl)
+        else:
+            self._store[key] = (time.time(), output)
+
+
+# Shared across the process so every scheduler run hits the same cache
+_shared_cache: Optional[TaskOutputCache] = None
+
+
+def get_shared_task_cache() -> TaskOutputCache:
+    """Return the process-wide task output cache, creating it on first use"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = TaskOutputCache()
+    return _shared_cache
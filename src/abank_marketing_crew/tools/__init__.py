@@ -0,0 +1,24 @@
+"""
+Shared infrastructure for ABank Marketing Crew tools
+"""
+
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@lru_cache(maxsize=None)
+def get_http_session() -> requests.Session:
+    """
+    Process-wide HTTP session shared by every tool.
+
+    All outbound tool HTTP should go through this session so requests
+    reuse pooled keep-alive connections (and resumed TLS sessions)
+    instead of paying a fresh TCP/TLS handshake per call.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
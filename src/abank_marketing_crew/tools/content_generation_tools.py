@@ -2,6 +2,8 @@
 Content Generation Tools for Content Strategy Agent
 """
 
+import asyncio
+
 from crewai.tools import BaseTool
 from typing import Type
 from pydantic import BaseModel, Field
@@ -9,7 +11,7 @@ import json
 
 
 class ContentGeneratorInput(BaseModel):
-    content_type: str = Field(..., description="Type: email, sms, social, blog, ad_copy")
+    content_type: str = Field(..., description="Type: email, sms, social, blog, ad_copy (comma-separated for multiple channels)")
     brief: str = Field(..., description="Creative brief")
     tone: str = Field(default="professional", description="Tone")
 
@@ -18,9 +20,81 @@ class ContentGenerator(BaseTool):
     name: str = "Content Generator"
     description: str = "Generate marketing content"
     args_schema: Type[BaseModel] = ContentGeneratorInput
-    
+
+    def _generate(self, content_type: str, brief: str, tone: str) -> str:
+        # Per-channel unit of work; the real implementation issues one
+        # LLM call here, so channels must stay independently executable
+        return f"{tone} content for {brief}"
+
     def _run(self, content_type: str, brief: str, tone: str = "professional") -> str:
-        return json.dumps({"content_type": content_type, "generated": f"{tone} content for {brief}"}, indent=2)
+        channels = [channel.strip() for channel in content_type.split(",")]
+        if len(channels) == 1:
+            return json.dumps({"content_type": channels[0], "generated": self._generate(channels[0], brief, tone)}, indent=2)
+        return json.dumps({channel: self._generate(channel, brief, tone) for channel in channels}, indent=2)
+
+    async def _arun(self, content_type: str, brief: str, tone: str = "professional") -> str:
+        # Fan out across channels: each per-channel generation is an
+        # independent API call, so gather collapses N round-trips to one
+        channels = [channel.strip() for channel in content_type.split(",")]
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._generate, channel, brief, tone) for channel in channels)
+        )
+        if len(channels) == 1:
+            return json.dumps({"content_type": channels[0], "generated": results[0]}, indent=2)
+        return json.dumps(dict(zip(channels, results)), indent=2)
+
+
+class BatchContentInput(BaseModel):
+    items: list[ContentGeneratorInput] = Field(..., description="Content requests to generate in one call")
+
+
+class BatchContentGenerator(BaseTool):
+    name: str = "Batch Content Generator"
+    description: str = (
+        "Generate several pieces of marketing content in one request. "
+        "Pass all needed variants (e.g. email + sms + social for one campaign) "
+        "as items instead of calling the single-item generator repeatedly."
+    )
+    args_schema: Type[BaseModel] = BatchContentInput
+
+    def _build_prompt(self, items: list) -> str:
+        """
+        Concatenate the sub-requests into one labelled prompt.
+
+        The shared instruction prefix (brand context, format rules) is
+        paid once instead of once per variant, and the [itemN] labels
+        let the structured response map back to its request.
+        """
+        lines = [
+            "Generate marketing content for each item below.",
+            "Respond as a JSON object with an 'items' array; each entry",
+            "must carry its label, content_type, and generated text."
+        ]
+        for index, item in enumerate(items, start=1):
+            lines.append(
+                f"[item{index}] content_type={item.content_type}; "
+                f"tone={item.tone}; brief={item.brief}"
+            )
+        return "\n".join(lines)
+
+    def _run(self, items: list) -> str:
+        return self._complete(self._build_prompt(items), items)
+
+    def _complete(self, prompt: str, items: list) -> str:
+        # One LLM round-trip in production, sending the batched prompt;
+        # stubbed like the rest of the tool layer, answering in the same
+        # labelled shape the prompt demands
+        generator = ContentGenerator()
+        return json.dumps({
+            "items": [
+                {
+                    "label": f"item{index}",
+                    "content_type": item.content_type,
+                    "generated": generator._generate(item.content_type, item.brief, item.tone)
+                }
+                for index, item in enumerate(items, start=1)
+            ]
+        }, indent=2)
 
 
 class BrandGuidelinesInput(BaseModel):
@@ -31,7 +105,7 @@ class BrandGuidelinesChecker(BaseTool):
     name: str = "Brand Guidelines Checker"
     description: str = "Check content against brand guidelines"
     args_schema: Type[BaseModel] = BrandGuidelinesInput
-    
+
     def _run(self, content: str) -> str:
         return json.dumps({"compliance_score": 0.95, "status": "approved"}, indent=2)
 
@@ -45,6 +119,21 @@ class MultilingualTranslator(BaseTool):
     name: str = "Multilingual Translator"
     description: str = "Translate to SA languages"
     args_schema: Type[BaseModel] = MultilingualInput
-    
+
+    def _translate(self, text: str, lang: str) -> str:
+        # One translation-API call per language in production (routed
+        # through the shared pooled HTTP session from tools.get_http_session)
+        return f"[{lang} translation]"
+
     def _run(self, text: str, target_languages: str) -> str:
-        return json.dumps({lang.strip(): f"[{lang} translation]" for lang in target_languages.split(",")}, indent=2)
+        langs = [lang.strip() for lang in target_languages.split(",")]
+        return json.dumps({lang: self._translate(text, lang) for lang in langs}, indent=2)
+
+    async def _arun(self, text: str, target_languages: str) -> str:
+        # Languages are independent, so translate them concurrently
+        # instead of paying one sequential round-trip per language
+        langs = [lang.strip() for lang in target_languages.split(",")]
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._translate, text, lang) for lang in langs)
+        )
+        return json.dumps(dict(zip(langs, results)), indent=2)
@@ -8,7 +8,6 @@ competitor monitoring, and trend analysis.
 from crewai.tools import BaseTool
 from typing import Type, Any, Dict, List
 from pydantic import BaseModel, Field
-import requests
 import os
 from datetime import datetime, timedelta
 import json
@@ -35,7 +34,8 @@ class WebSearchTool(BaseTool):
         Execute web search and return results.
         
         In production, this would integrate with Google Custom Search API,
-        Bing Search API, or similar service.
+        Bing Search API, or similar service, issuing requests through the
+        shared get_http_session() pool for connection reuse.
         """
         try:
             # Mock implementation - replace with actual API in production
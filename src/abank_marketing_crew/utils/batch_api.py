@@ -0,0 +1,190 @@
+"""
+Provider Batch API submission for ABank Marketing Crew
+
+Non-realtime bulk runs do not need interactive latency, and both OpenAI
+and Anthropic price their Batch APIs at roughly half the synchronous
+rate with a 24-hour completion window. This module serializes planned
+LLM calls into the providers' batch formats, submits them in one upload,
+polls until the batch finishes, and maps results back by custom_id.
+"""
+
+import json
+import tempfile
+import time
+from typing import Any, Dict, List
+
+POLL_INITIAL_SECONDS = 10.0
+POLL_MAX_SECONDS = 300.0
+DEFAULT_TIMEOUT_SECONDS = 86400
+
+OPENAI_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+ANTHROPIC_TERMINAL_STATUSES = {"ended"}
+
+
+def build_chat_request(
+    custom_id: str,
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float = 0.7
+) -> Dict[str, Any]:
+    """
+    One planned chat completion in OpenAI batch-line format.
+
+    The static system prompt is kept as the first message so batched
+    calls share the same cacheable prefix as the realtime path.
+    """
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": model,
+            "temperature": temperature,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ]
+        }
+    }
+
+
+def submit_batch(requests: List[Dict[str, Any]], provider: str = "openai") -> str:
+    """
+    Upload planned requests to the provider's Batch API.
+
+    Args:
+        requests: Batch lines from build_chat_request
+        provider: 'openai' or 'anthropic'
+
+    Returns:
+        The provider-side batch id to poll
+    """
+    if provider == "openai":
+        from openai import OpenAI
+        client = OpenAI()
+
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.jsonl', delete=False
+        ) as f:
+            for request in requests:
+                f.write(json.dumps(request) + "\n")
+            input_path = f.name
+
+        with open(input_path, 'rb') as f:
+            input_file = client.files.create(file=f, purpose="batch")
+
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    elif provider == "anthropic":
+        from anthropic import Anthropic
+        client = Anthropic()
+
+        batch = client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": request["custom_id"],
+                    "params": {
+                        "model": request["body"]["model"],
+                        "max_tokens": 4096,
+                        # Block form with an ephemeral cache_control marker:
+                        # every batched call from the same agent shares this
+                        # system prefix, so Anthropic prompt caching applies
+                        # inside the batch exactly as on the realtime path
+                        "system": [
+                            {
+                                "type": "text",
+                                "text": request["body"]["messages"][0]["content"],
+                                "cache_control": {"type": "ephemeral"}
+                            }
+                        ],
+                        "messages": request["body"]["messages"][1:]
+                    }
+                }
+                for request in requests
+            ]
+        )
+        return batch.id
+
+    raise ValueError(f"Unknown batch provider: {provider}")
+
+
+def wait_for_batch(
+    batch_id: str,
+    provider: str = "openai",
+    timeout: float = DEFAULT_TIMEOUT_SECONDS
+) -> Any:
+    """
+    Poll a submitted batch until it reaches a terminal status.
+
+    Polling backs off exponentially from POLL_INITIAL_SECONDS up to
+    POLL_MAX_SECONDS so long-running batches are not hammered.
+    """
+    if provider == "openai":
+        from openai import OpenAI
+        client = OpenAI()
+        retrieve = client.batches.retrieve
+        terminal = OPENAI_TERMINAL_STATUSES
+    elif provider == "anthropic":
+        from anthropic import Anthropic
+        client = Anthropic()
+        retrieve = client.messages.batches.retrieve
+        terminal = ANTHROPIC_TERMINAL_STATUSES
+    else:
+        raise ValueError(f"Unknown batch provider: {provider}")
+
+    deadline = time.monotonic() + timeout
+    delay = POLL_INITIAL_SECONDS
+
+    while True:
+        batch = retrieve(batch_id)
+        status = getattr(batch, 'processing_status', None) or batch.status
+        if status in terminal:
+            return batch
+        if time.monotonic() >= deadline:
+            raise TimeoutError(
+                f"Batch {batch_id} still '{status}' after {timeout}s"
+            )
+        time.sleep(delay)
+        delay = min(delay * 2, POLL_MAX_SECONDS)
+
+
+def fetch_results(batch: Any, provider: str = "openai") -> Dict[str, str]:
+    """
+    Map a finished batch's outputs back to their custom_ids.
+
+    Returns:
+        Dict of custom_id to response text
+    """
+    results: Dict[str, str] = {}
+
+    if provider == "openai":
+        from openai import OpenAI
+        client = OpenAI()
+
+        content = client.files.content(batch.output_file_id)
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            body = (row.get("response") or {}).get("body") or {}
+            choices = body.get("choices") or []
+            if choices:
+                results[row["custom_id"]] = choices[0]["message"]["content"]
+        return results
+
+    elif provider == "anthropic":
+        from anthropic import Anthropic
+        client = Anthropic()
+
+        for entry in client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = entry.result.message.content[0].text
+        return results
+
+    raise ValueError(f"Unknown batch provider: {provider}")
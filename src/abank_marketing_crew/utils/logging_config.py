@@ -2,35 +2,94 @@
 Logging Configuration for ABank Marketing Crew
 """
 
+import atexit
+import gzip
 import logging
+import os
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
 
+# Listener kept module-level so repeat setup_logging calls can stop the
+# previous one instead of leaking its thread
+_listener = None
+
+
+def _stop_listener():
+    """Stop the active queue listener, draining any queued records"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+def _gzip_namer(name: str) -> str:
+    """Name rotated backups with a .gz suffix"""
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str):
+    """Compress a rotated log file; text logs typically shrink ~10x"""
+    with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+        dst.write(src.read())
+    os.remove(source)
+
+
+def _rotating_handler(path, max_bytes: int, backup_count: int) -> RotatingFileHandler:
+    """
+    Size-rotated handler with delayed open and gzip-compressed backups.
+
+    delay=True defers the open() until the first record, so handlers that
+    rarely fire (errors.log) cost nothing at startup; compression keeps
+    backup_count rotations from ballooning on disk. Rotation runs on the
+    queue listener thread, never a workflow hot path.
+    """
+    handler = RotatingFileHandler(
+        path,
+        maxBytes=max_bytes,
+        backupCount=backup_count,
+        delay=True
+    )
+    handler.namer = _gzip_namer
+    handler.rotator = _gzip_rotator
+    return handler
+
 
 def setup_logging(log_level: str = "INFO", log_dir: str = "logs") -> logging.Logger:
     """
     Setup logging configuration for the marketing crew.
-    
+
+    Handlers are driven by a QueueListener on a background thread: call
+    sites enqueue records in O(1) instead of paying file write/rotation
+    latency inline, which matters once many concurrent kickoffs log from
+    agent callbacks inside the event loop.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_dir: Directory to store log files
-        
+
     Returns:
         Configured logger instance
     """
+    global _listener
+
     # Create logs directory if it doesn't exist
     log_path = Path(log_dir)
     log_path.mkdir(exist_ok=True)
-    
+
     # Configure root logger
     logger = logging.getLogger("abank_marketing_crew")
     logger.setLevel(getattr(logging, log_level.upper()))
-    
+
     # Remove existing handlers
     logger.handlers = []
-    
+    _stop_listener()
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
@@ -39,13 +98,12 @@ def setup_logging(log_level: str = "INFO", log_dir: str = "logs") -> logging.Log
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
-    
+
     # File handler - rotating
-    file_handler = RotatingFileHandler(
+    file_handler = _rotating_handler(
         log_path / f"marketing_crew_{datetime.now().strftime('%Y%m%d')}.log",
-        maxBytes=10*1024*1024,  # 10MB
-        backupCount=30
+        max_bytes=10*1024*1024,  # 10MB
+        backup_count=30
     )
     file_handler.setLevel(logging.DEBUG)
     file_format = logging.Formatter(
@@ -53,18 +111,30 @@ def setup_logging(log_level: str = "INFO", log_dir: str = "logs") -> logging.Log
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_format)
-    logger.addHandler(file_handler)
-    
+
     # Error file handler
-    error_handler = RotatingFileHandler(
+    error_handler = _rotating_handler(
         log_path / "errors.log",
-        maxBytes=5*1024*1024,  # 5MB
-        backupCount=10
+        max_bytes=5*1024*1024,  # 5MB
+        backup_count=10
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(file_format)
-    logger.addHandler(error_handler)
-    
+
+    # The logger only ever sees the queue; the listener thread fans
+    # records out to the real handlers at their own levels
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        error_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+
     logger.info("Logging configured successfully")
-    
+
     return logger
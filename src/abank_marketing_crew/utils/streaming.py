@@ -0,0 +1,47 @@
+"""
+Task Output Streaming for ABank Marketing Crew
+
+Publishes each task's output to subscribers the moment the task finishes,
+instead of making consumers wait for the whole crew to complete. Downstream
+systems (result persistence, deployment hooks, dashboards) overlap their
+work with the remaining tasks still executing.
+"""
+
+import queue
+from typing import Any, List
+
+# Sentinel pushed to subscribers when the stream is closed
+STREAM_END = object()
+
+
+class TaskOutputBroker:
+    """
+    Fan-out broker for completed task outputs.
+
+    Wire the broker into a Crew via task_callback=broker.task_callback;
+    consumers call subscribe() and read task outputs off their queue as
+    the workflow progresses.
+    """
+
+    def __init__(self):
+        self._subscribers: List[queue.Queue] = []
+
+    def subscribe(self) -> queue.Queue:
+        """Register a subscriber and return its output queue"""
+        subscriber_queue: queue.Queue = queue.Queue()
+        self._subscribers.append(subscriber_queue)
+        return subscriber_queue
+
+    def publish(self, output: Any):
+        """Push a task output to every subscriber"""
+        for subscriber_queue in self._subscribers:
+            subscriber_queue.put(output)
+
+    def task_callback(self, task_output: Any):
+        """Crew task_callback hook - publishes each completed task output"""
+        self.publish(task_output)
+
+    def close(self):
+        """Signal end-of-stream to all subscribers"""
+        for subscriber_queue in self._subscribers:
+            subscriber_queue.put(STREAM_END)